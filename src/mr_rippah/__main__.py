@@ -1,86 +1,263 @@
-import argparse
 import logging
+import sys
 import time
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, NoReturn
 
-from mr_rippah import MrRippah
-from mr_rippah.update_checker import check_for_update
-from rich import box
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.table import Table
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
+    from rich.console import Console
 
-def main():
-    parser = argparse.ArgumentParser(description="Mr. Rippah")
-    parser.add_argument(
-        "uri",
-        help="Spotify playlist or track URI",
-    )
-    parser.add_argument(
-        "--credentials-path",
-        type=Path,
-        help="path to Spotify credentials file",
-    )
-    parser.add_argument(
-        "--download-directory",
-        type=Path,
-        help="directory to save downloaded tracks",
-    )
-    parser.add_argument(
-        "-c",
-        "--clear-spotify-credentials",
-        action="store_true",
-        help="clear existing Spotify credentials",
-    )
-    verbosity_group = parser.add_mutually_exclusive_group()
-    verbosity_group.add_argument(
-        "-v", "--verbose", action="store_true", help="enable verbose logging"
-    )
-    verbosity_group.add_argument(
-        "-q",
-        "--quiet",
-        action="store_true",
-        help="suppress logging output",
-    )
-    parser.add_argument(
-        "--no-update-check",
-        action="store_true",
-        help="disable automatic update checking",
+USAGE = (
+    "usage: mr-rippah [-h] [--credentials-path CREDENTIALS_PATH]\n"
+    "                 [--download-directory DOWNLOAD_DIRECTORY]\n"
+    "                 [-j PARALLEL_DOWNLOADS] [--format {mp3,ogg}] [-f] [-c]\n"
+    "                 [-v | -q] [--no-update-check]\n"
+    "                 uri\n"
+)
+
+HELP_TEXT = (
+    USAGE
+    + """
+Mr. Rippah
+
+positional arguments:
+  uri                   Spotify playlist or track URI
+
+options:
+  -h, --help            show this help message and exit
+  --credentials-path CREDENTIALS_PATH
+                        path to Spotify credentials file
+  --download-directory DOWNLOAD_DIRECTORY
+                        directory to save downloaded tracks
+  -j, --parallel-downloads PARALLEL_DOWNLOADS
+                        number of playlist tracks to rip concurrently
+                        (default: 4)
+  --format {mp3,ogg}    audio format to save tracks in; ogg keeps Spotify's
+                        stream as is, without converting it (default: mp3)
+  -f, --force           re-rip tracks that have already been downloaded
+  -c, --clear-spotify-credentials
+                        clear existing Spotify credentials
+  -v, --verbose         enable verbose logging
+  -q, --quiet           suppress logging output
+  --no-update-check     disable automatic update checking
+"""
+)
+
+# Boolean flags, mapped to the attribute they set
+FLAGS = {
+    "-f": "force",
+    "--force": "force",
+    "-c": "clear_spotify_credentials",
+    "--clear-spotify-credentials": "clear_spotify_credentials",
+    "-v": "verbose",
+    "--verbose": "verbose",
+    "-q": "quiet",
+    "--quiet": "quiet",
+    "--no-update-check": "no_update_check",
+}
+
+# Flags that take a value, either as the next token or after "=", mapped to the
+# attribute they set and the type the value is converted to
+VALUE_FLAGS = {
+    "--credentials-path": ("credentials_path", Path),
+    "--download-directory": ("download_directory", Path),
+    "-j": ("parallel_downloads", int),
+    "--parallel-downloads": ("parallel_downloads", int),
+    "--format": ("output_format", str),
+}
+
+# Mirrors rippah.OUTPUT_FORMATS, checked here so bad values fail before connecting
+OUTPUT_FORMATS = ("mp3", "ogg")
+
+
+# How long startup waits for the background update check before moving on
+UPDATE_CHECK_TIMEOUT_SECONDS = 0.5
+
+# How long exit waits for an update check that was still running at startup
+UPDATE_CHECK_EXIT_TIMEOUT_SECONDS = 0.1
+
+# Log level indexed by verbose + 2 * quiet
+LOG_LEVELS = (logging.INFO, logging.DEBUG, logging.ERROR)
+
+_console = None
+_stdout_console = None
+
+
+def _get_console() -> "Console":
+    """Return the shared stderr rich Console, creating it on first use.
+
+    Logs, the spinner and update notices all go to stderr, so stdout only
+    carries the failed tracks table or CSV.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console(stderr=True)
+    return _console
+
+
+def _get_stdout_console() -> "Console":
+    """Return the shared stdout rich Console, creating it on first use."""
+    global _stdout_console
+    if _stdout_console is None:
+        from rich.console import Console
+
+        _stdout_console = Console()
+    return _stdout_console
+
+
+def _error(message: str) -> NoReturn:
+    """Print usage and an error message to stderr, then exit with status 2."""
+    sys.stderr.write(USAGE)
+    sys.stderr.write(f"mr-rippah: error: {message}\n")
+    sys.exit(2)
+
+
+def _print_update_notice(update_check: "Future", timeout: float) -> bool:
+    """Print an update notice if the background update check found one.
+
+    Args:
+        update_check: Future returned by check_for_update_async().
+        timeout: Seconds to wait for the check to finish.
+
+    Returns:
+        True if the check has finished, False if it is still running.
+    """
+    try:
+        update_available = update_check.result(timeout=timeout)
+    except TimeoutError:
+        return False
+    except Exception:
+        return True  # Silently ignore any errors
+
+    if update_available:
+        current_ver, latest_ver = update_available
+        _get_console().print(
+            f"[yellow]Update available: mr-rippah {current_ver} → {latest_ver}\n"
+            "Run: uv tool install --upgrade 'git+https://github.com/cvdub/mr-rippah'"
+            "[/yellow]\n"  # Trailing blank line for spacing
+        )
+    return True
+
+
+def _parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Command line arguments, excluding the program name.
+
+    Returns:
+        Namespace with one attribute per option plus the positional uri.
+    """
+    args = SimpleNamespace(
+        uri=None,
+        credentials_path=None,
+        download_directory=None,
+        parallel_downloads=4,
+        output_format="mp3",
+        force=False,
+        clear_spotify_credentials=False,
+        verbose=False,
+        quiet=False,
+        no_update_check=False,
     )
+    # Help takes precedence over every other argument, even invalid ones
+    options = argv[: argv.index("--")] if "--" in argv else argv
+    if "-h" in options or "--help" in options:
+        sys.stdout.write(HELP_TEXT)
+        sys.exit(0)
+
+    positionals = []
+    it = iter(argv)
+    for arg in it:
+        if arg == "--":
+            positionals.extend(it)
+        elif arg in FLAGS:
+            setattr(args, FLAGS[arg], True)
+        elif arg.startswith("-") and arg != "-":
+            flag, has_value, value = arg.partition("=")
+            if flag not in VALUE_FLAGS and not arg.startswith("--"):
+                # Combined short options, e.g. "-cv", "-j4" or "-cj4"
+                for i, letter in enumerate(arg[1:], 2):
+                    flag = f"-{letter}"
+                    if flag in FLAGS:
+                        setattr(args, FLAGS[flag], True)
+                    elif flag in VALUE_FLAGS:
+                        value = arg[i:]
+                        has_value = bool(value)
+                        break
+                    else:
+                        _error(f"unrecognized arguments: {arg}")
+                else:
+                    continue
+            if flag not in VALUE_FLAGS:
+                _error(f"unrecognized arguments: {arg}")
+            if not has_value:
+                value = next(it, None)
+                if value is None:
+                    _error(f"argument {flag}: expected one argument")
+            attr, type_ = VALUE_FLAGS[flag]
+            try:
+                setattr(args, attr, type_(value))
+            except ValueError:
+                _error(f"argument {flag}: invalid {type_.__name__} value: {value!r}")
+        else:
+            positionals.append(arg)
+
+    if not positionals:
+        _error("the following arguments are required: uri")
+    if len(positionals) > 1:
+        _error(f"unrecognized arguments: {' '.join(positionals[1:])}")
+    if args.verbose and args.quiet:
+        _error("argument -q/--quiet: not allowed with argument -v/--verbose")
+    if args.parallel_downloads < 1:
+        _error("argument -j/--parallel-downloads: must be at least 1")
+    if args.output_format not in OUTPUT_FORMATS:
+        _error(
+            f"argument --format: invalid choice: {args.output_format!r} "
+            f"(choose from {', '.join(OUTPUT_FORMATS)})"
+        )
+
+    args.uri = positionals[0]
+    return args
 
-    args = parser.parse_args()
 
-    # Check for updates before logging is configured
-    update_available = None
+def main():
+    args = _parse_args(sys.argv[1:])
+
+    # Check for updates in the background while the rest of startup runs
+    update_check = None
     if not args.no_update_check:
-        try:
-            update_available = check_for_update()
-        except Exception:
-            pass  # Silently ignore any errors
-
-    # Set the log level
-    args = parser.parse_args()
-    if args.verbose:
-        log_level = logging.DEBUG
-    elif args.quiet:
-        log_level = logging.ERROR
+        from mr_rippah.update_checker import check_for_update_async
+
+        update_check = check_for_update_async()
+
+    # Set the log level; -v and -q are mutually exclusive so the index is 0, 1 or 2
+    log_level = LOG_LEVELS[args.verbose + 2 * args.quiet]
+
+    # Configure logging with RichHandler on a terminal, plain lines otherwise
+    if sys.stderr.isatty():
+        from rich.logging import RichHandler
+
+        handler = RichHandler(
+            console=_get_console(),
+            show_time=False,
+            show_path=False,
+            show_level=False,
+            markup=False,
+            rich_tracebacks=True,
+        )
     else:
-        log_level = logging.INFO
+        handler = logging.StreamHandler()
 
-    # Configure logging with RichHandler
     logging.basicConfig(
         level=logging.WARNING,  # Set root logger to WARNING to suppress dependency logs
         format="%(message)s",
-        handlers=[
-            RichHandler(
-                show_time=False,
-                show_path=False,
-                show_level=False,
-                markup=False,
-                rich_tracebacks=True,
-            )
-        ],
+        handlers=[handler],
     )
 
     # Only set application logger to user-specified level
@@ -90,76 +267,105 @@ def main():
     if log_level == logging.DEBUG:
         logger.debug("Log level set to debug")
 
+    # Deferred until the arguments are valid so --help and usage errors stay fast
+    from mr_rippah import MrRippah
+    from mr_rippah.rippah import RipFailedError
+
     # Display update notification if available and not in quiet mode
-    if update_available and log_level != logging.ERROR:
-        current_ver, latest_ver = update_available
-        console = Console()
-        console.print(
-            f"[yellow]Update available: mr-rippah {current_ver} → {latest_ver}[/yellow]"
-        )
-        console.print(
-            "[yellow]Run: uv tool install --upgrade 'git+https://github.com/cvdub/mr-rippah'[/yellow]"
-        )
-        console.print()  # Blank line for spacing
+    show_update_notice = update_check is not None and log_level != logging.ERROR
+    if show_update_notice and _print_update_notice(
+        update_check, UPDATE_CHECK_TIMEOUT_SECONDS
+    ):
+        show_update_notice = False
 
     if args.clear_spotify_credentials:
         logger.info("Clearing existing Spotify credentials")
         credentials_path = args.credentials_path or MrRippah.default_credentials_path()
         credentials_path.unlink(missing_ok=True)
 
+    # Normalize URL to URI and detect type before connecting to Spotify
+    uri = MrRippah.spotify_url_to_uri(args.uri)
+    uri_type = MrRippah.spotify_uri_type(uri)
+    if uri_type is None:
+        _error(f"invalid Spotify URI: {uri} (must be a Spotify playlist or track)")
+
     with MrRippah(
         credentials_path=args.credentials_path,
         download_directory=args.download_directory,
+        parallel_downloads=args.parallel_downloads,
+        output_format=args.output_format,
     ) as mr:
-        # Normalize URL to URI and detect type
-        uri = MrRippah.spotify_url_to_uri(args.uri)
-
-        if MrRippah.is_spotify_playlist_uri(uri):
-            results = mr.rip_playlist(uri)
-        elif MrRippah.is_spotify_track_uri(uri):
-            start_time = time.perf_counter()
+        if uri_type == "playlist":
+            results = mr.rip_playlist(uri, force=args.force)
+        else:
+            start_time = time.monotonic_ns()
             show_spinner = not args.verbose and not args.quiet
-            if show_spinner:
-                console = Console()
-                with console.status("Ripping track..."):
-                    result = mr.rip_track(uri, download_directory=None)
-            else:
-                result = mr.rip_track(uri, download_directory=None)
-
-            end_time = time.perf_counter()
+            try:
+                if show_spinner:
+                    console = _get_console()
+                    with console.status("Ripping track..."):
+                        result = mr.rip_track(
+                            uri, download_directory=None, force=args.force
+                        )
+                else:
+                    result = mr.rip_track(
+                        uri, download_directory=None, force=args.force
+                    )
+            except RipFailedError as e:
+                # Already reported in full, so exit without a traceback
+                logger.error(f"{e.uri} {e}")
+                sys.exit(1)
+
+            elapsed_seconds = (time.monotonic_ns() - start_time) / 1e9
             logger.info(
-                f"Ripped {1 if result.success else 0}/1 tracks in {end_time - start_time:,.2f} seconds"
+                f"Ripped {1 if result.success else 0}/1 tracks in {elapsed_seconds:,.2f} seconds"
             )
             if result.success:
                 logger.info(f"Track saved to {result.path}")
             results = [result]
-        else:
-            logger.error(f"Invalid Spotify URI: {uri}")
-            logger.error("URI must be a Spotify playlist or track")
-            parser.error(f"Invalid Spotify URI: {uri}")
 
-    failures = [result for result in results if not result.success]
-    if failures:
-        console = Console()
+    # Collect failed rows and the widest reason in a single pass over results
+    rows = []
+    reason_width = 0
+    for result in results:
+        if result.success:
+            continue
+        reason = result.failure_reason
+        reason_width = max(reason_width, len(reason))
+        rows.append((reason, result.title, result.uri))
+
+    if rows and not sys.stdout.isatty():
+        # Plain CSV is easier to grep or load than a table when output is piped
+        import csv
+
+        writer = csv.writer(sys.stdout)
+        writer.writerow(("reason", "title", "uri"))
+        writer.writerows(rows)
+    elif rows:
+        from rich import box
+        from rich.table import Table
+
         table = Table(
-            title=f"Failed to rip {len(failures):,} tracks",
+            title=f"Failed to rip {len(rows):,} tracks",
             show_header=True,
             header_style="bold",
             title_style="bold red",
             title_justify="left",
             box=box.SIMPLE,
         )
-        reason_width = max(len(result.failure_reason) for result in failures)
         table.add_column("Reason", no_wrap=True, min_width=reason_width, style="yellow")
         table.add_column("Title", no_wrap=True)
         table.add_column("URI", no_wrap=True, min_width=36)
 
-        for result in failures:
-            table.add_row(
-                result.failure_reason, result.title or "<Unknown>", result.uri
-            )
+        add_row = table.add_row
+        for reason, title, track_uri in rows:
+            add_row(reason, title or "<Unknown>", track_uri)
+
+        _get_stdout_console().print(table)
 
-        console.print(table)
+    # A check that was too slow for startup gets one last look before exiting
+    if show_update_notice:
+        _print_update_notice(update_check, UPDATE_CHECK_EXIT_TIMEOUT_SECONDS)
 
 
 if __name__ == "__main__":
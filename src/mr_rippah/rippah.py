@@ -1,21 +1,47 @@
+import base64
+import functools
 import logging
+import os
+import random
 import re
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
 import time
-import warnings
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from io import BytesIO
 from pathlib import Path
-from typing import Self
+from typing import BinaryIO, Self
 
 import requests
+from librespot.audio import AbsChunkedInputStream, CdnManager
 from librespot.audio.decoders import AudioQuality, VorbisOnlyAudioQuality
 from librespot.core import Session
 from librespot.metadata import PlaylistId, TrackId
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import APIC, COMM, ID3, TXXX
+from librespot.proto import Metadata_pb2 as Metadata
+from mutagen.flac import Picture
+from mutagen.id3 import (
+    APIC,
+    COMM,
+    ID3,
+    TALB,
+    TDRC,
+    TIT2,
+    TPE1,
+    TPE2,
+    TPOS,
+    TRCK,
+    TSRC,
+    TXXX,
+)
+from mutagen.oggvorbis import OggVorbis
 from platformdirs import user_cache_dir, user_downloads_dir
+from requests.adapters import HTTPAdapter
+from rich.console import Console
 from rich.progress import (
     BarColumn,
     MofNCompleteColumn,
@@ -24,15 +50,68 @@ from rich.progress import (
     TextColumn,
 )
 
-with warnings.catch_warnings(action="ignore", category=SyntaxWarning):
-    from pydub import AudioSegment
-
 SPOTIFY_CDN_URL = "https://i.scdn.co/image/"
-SPOTIFY_PLAYLIST_REGEX = re.compile(r"^spotify:playlist:[A-Za-z0-9]{22}$")
-SPOTIFY_TRACK_REGEX = re.compile(r"^spotify:track:[A-Za-z0-9]{22}$")
+SPOTIFY_WEB_URL = "https://open.spotify.com/"
+SPOTIFY_URI_PREFIXES = {"playlist": "spotify:playlist:", "track": "spotify:track:"}
+SPOTIFY_PLAYLIST_REGEX = re.compile(r"spotify:playlist:[A-Za-z0-9]{22}")
+SPOTIFY_TRACK_REGEX = re.compile(r"spotify:track:[A-Za-z0-9]{22}")
+SPOTIFY_URI_REGEX = re.compile(r"spotify:(playlist|track):[A-Za-z0-9]{22}")
+SPOTIFY_URL_REGEX = re.compile(r"/(playlist|track)/([A-Za-z0-9]{22})")
+# Characters that aren't allowed in file names on Windows, macOS or Linux
+ILLEGAL_PATH_CHARACTERS_REGEX = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+METADATA_PREFETCH_WORKERS = 8
+ID3_PADDING_BYTES = 4096
+ALBUM_ART_CACHE_SIZE = 32
+OUTPUT_FORMATS = ("mp3", "ogg")
+
+# ID3 frame for each text tag, keyed by the tag's Vorbis comment name
+ID3_TEXT_FRAMES = {
+    "title": TIT2,
+    "artist": TPE1,
+    "album": TALB,
+    "albumartist": TPE2,
+    "tracknumber": TRCK,
+    "discnumber": TPOS,
+    "date": TDRC,
+    "isrc": TSRC,
+}
+# Reads Ogg Vorbis on stdin and writes a VBR MP3 to the path appended to it
+FFMPEG_MP3_COMMAND = (
+    "ffmpeg",
+    "-nostdin",
+    "-hide_banner",
+    "-loglevel",
+    "error",
+    "-y",
+    "-f",
+    "ogg",
+    "-i",
+    "pipe:0",
+    "-c:a",
+    "libmp3lame",
+    "-q:a",
+    "0",
+    "-f",
+    "mp3",
+)
+
+# Stream errors worth retrying: network and HTTP failures, and librespot's chunk,
+# audio key and CDN lookup failures. Other OSErrors (a full disk, a read-only
+# download directory, a missing ffmpeg) won't go away by retrying
+TRANSIENT_ERRORS = (
+    requests.RequestException,
+    ConnectionError,
+    TimeoutError,
+    AbsChunkedInputStream.ChunkException,
+    RuntimeError,
+    CdnManager.CdnException,
+)
 
 logger = logging.getLogger(__name__)
 
+# Each playlist track's URI is parsed by both the metadata prefetch and the rip
+_track_id_from_uri = functools.lru_cache(maxsize=4096)(TrackId.from_uri)
+
 
 class RipFailedError(Exception):
     def __init__(
@@ -48,19 +127,52 @@ class RipFailedError(Exception):
         self.original_error = original_error
 
 
+@functools.lru_cache(maxsize=1024)
+def sanitize_path_component(name: str) -> str:
+    """Make a string safe to use as a single file or directory name.
+
+    Results are cached, since tracks from the same album share their artist and
+    album names.
+
+    Args:
+        name: Name from Spotify metadata, e.g. an artist, album or track name.
+
+    Returns:
+        name with illegal characters replaced by underscores and trailing dots and
+        spaces removed, or "_" if nothing is left.
+    """
+    return ILLEGAL_PATH_CHARACTERS_REGEX.sub("_", name).rstrip(". ") or "_"
+
+
 def make_unique_directory(path: Path):
-    if not path.exists():
-        path.mkdir()
+    try:
+        path.mkdir(parents=True)
         return path
-
-    # otherwise append a number
-    i = 1
+    except FileExistsError:
+        pass
+
+    # Otherwise append the number after the highest one already used, listing the
+    # parent once instead of checking each candidate. mkdir is still attempted on
+    # each candidate, so two rips racing for the same name never share a directory
+    prefix = f"{path.name} ("
+    i = 0
+    with os.scandir(path.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(")")):
+                continue
+            # isdecimal, unlike isdigit, rejects digits int() can't parse ("²")
+            suffix = name[len(prefix) : -1]
+            if suffix.isdecimal():
+                i = max(i, int(suffix))
     while True:
+        i += 1
         candidate = path.with_name(f"{path.name} ({i})")
-        if not candidate.exists():
+        try:
             candidate.mkdir()
             return candidate
-        i += 1
+        except FileExistsError:
+            pass
 
 
 @dataclass
@@ -72,6 +184,113 @@ class TrackRipResult:
     path: Path | None = None
 
 
+class _TokenBucket:
+    """Thread-safe token bucket used to rate limit requests.
+
+    Allows bursts of up to capacity requests, then one request every 1 / rate
+    seconds on average.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether a failed track download is worth retrying.
+
+    Args:
+        error: Exception raised while getting or saving the track stream.
+
+    Returns:
+        True for network and stream errors, False for anything else.
+    """
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    # librespot reports CDN HTTP failures as bare IOErrors, which unlike local
+    # filesystem errors (ENOSPC, EACCES, ENAMETOOLONG, ...) carry no errno
+    return isinstance(error, OSError) and error.errno is None
+
+
+def _save_id3_tags(
+    track_path: Path,
+    tags: dict[str, str],
+    spotify_track_uris: list[str],
+    image_data: bytes | None,
+) -> None:
+    """Write ID3 tags to an MP3 file.
+
+    Every frame is built in memory and the tag is written once, replacing the one
+    ffmpeg wrote, instead of re-opening and re-saving the file per frame type.
+
+    Args:
+        track_path: Path of the MP3 file.
+        tags: Text tags, keyed by their Vorbis comment names.
+        spotify_track_uris: Original and, if re-linked, final Spotify URI.
+        image_data: JPEG album art to embed, if any.
+    """
+    audio = ID3()
+    for key, value in tags.items():
+        audio.add(ID3_TEXT_FRAMES[key](encoding=3, text=value))
+    audio.add(TXXX(desc="spotify_uris", text=spotify_track_uris))
+    audio.add(COMM(encoding=3, lang="eng", desc="", text=[spotify_track_uris[0]]))
+    if image_data is not None:
+        audio.add(
+            APIC(encoding=3, mime="image/jpeg", type=3, desc="0", data=image_data)
+        )
+
+    # Reserve padding so later tag edits don't have to shift the audio
+    audio.save(track_path, padding=lambda info: ID3_PADDING_BYTES)
+
+
+def _save_vorbis_comments(
+    track_path: Path,
+    tags: dict[str, str],
+    spotify_track_uris: list[str],
+    image_data: bytes | None,
+) -> None:
+    """Write Vorbis comments to an Ogg Vorbis file.
+
+    Args:
+        track_path: Path of the Ogg file.
+        tags: Text tags, keyed by their Vorbis comment names.
+        spotify_track_uris: Original and, if re-linked, final Spotify URI.
+        image_data: JPEG album art to embed, if any.
+    """
+    audio = OggVorbis(track_path)
+    audio.update(tags)
+    audio["spotify_uris"] = spotify_track_uris
+    audio["comment"] = spotify_track_uris[0]
+    if image_data is not None:
+        picture = Picture()
+        picture.type = 3
+        picture.mime = "image/jpeg"
+        picture.desc = "0"
+        picture.data = image_data
+        audio["metadata_block_picture"] = base64.b64encode(picture.write()).decode(
+            "ascii"
+        )
+    audio.save()
+
+
 def spotify_oauth_callback(url: str) -> None:
     webbrowser.open(url)
 
@@ -80,7 +299,8 @@ class MrRippah:
     """Spotify playlist ripper that downloads tracks as MP3 files with metadata.
 
     This class handles authentication with Spotify, downloading tracks from playlists,
-    converting audio to MP3 format, and embedding ID3 metadata tags.
+    converting audio to MP3 format (or keeping the original Ogg Vorbis), and embedding
+    metadata tags.
 
     Attributes:
         credentials_path: Path to Spotify credentials JSON file.
@@ -89,8 +309,11 @@ class MrRippah:
         spotify_authentication_retries: Number of retry attempts for Spotify authentication.
         track_download_retries: Number of retry attempts for track downloads.
         retry_delay_seconds: Base delay in seconds between retry attempts.
-        successful_download_delay_seconds: Delay between successful downloads to avoid rate limiting.
+        successful_download_delay_seconds: Average delay between track stream requests to
+            avoid rate limiting.
         spotify_oauth_callback: Callback function invoked with OAuth URL during authentication.
+        parallel_downloads: Number of playlist tracks ripped concurrently.
+        output_format: Audio format tracks are saved in, "mp3" or "ogg".
     """
 
     credentials_path: Path
@@ -101,17 +324,21 @@ class MrRippah:
     retry_delay_seconds: int
     successful_download_delay_seconds: int
     spotify_oauth_callback: callable
+    parallel_downloads: int
+    output_format: str
 
     def __init__(
         self,
         credentials_path: Path | None = None,
         download_directory: Path | None = None,
-        download_chunk_size: int = 65_536,
+        download_chunk_size: int = 131_072,
         spotify_authentication_retries: int = 5,
         track_download_retries: int = 5,
         retry_delay_seconds: int = 5,
         successful_download_delay_seconds: int = 5,
         spotify_oauth_callback: callable = spotify_oauth_callback,
+        parallel_downloads: int = 4,
+        output_format: str = "mp3",
     ):
         """Initialize Mr. Rippah with configuration options.
 
@@ -120,16 +347,29 @@ class MrRippah:
                 cache directory if None.
             download_directory: Directory to save downloaded playlists. Defaults to user's
                 Downloads folder if None.
-            download_chunk_size: Size in bytes for streaming audio chunks. Defaults to 65536.
+            download_chunk_size: Size in bytes for streaming audio chunks. Defaults to 131072,
+                librespot's own chunk size, so each read returns one whole chunk.
             spotify_authentication_retries: Maximum authentication retry attempts. Defaults to 5.
             track_download_retries: Maximum download retry attempts per track. Defaults to 5.
-            retry_delay_seconds: Base delay between retries, multiplied by attempt number.
-                Defaults to 5.
-            successful_download_delay_seconds: Delay between successful track downloads to
-                avoid rate limiting. Defaults to 5.
+            retry_delay_seconds: Base delay between retries, doubled on each attempt
+                up to 8 times the base, with random jitter. Defaults to 5.
+            successful_download_delay_seconds: Average delay between track stream requests
+                to avoid rate limiting, after an initial burst of parallel_downloads
+                requests. 0 disables rate limiting. Defaults to 5.
             spotify_oauth_callback: Callback function invoked with OAuth URL during authentication.
                 Defaults to opening the URL in a web browser.
+            parallel_downloads: Number of playlist tracks ripped concurrently, each on its
+                own worker thread. Defaults to 4.
+            output_format: Audio format to save tracks in. "mp3" converts the Ogg Vorbis
+                stream with ffmpeg; "ogg" saves the stream as is, without re-encoding.
+                Defaults to "mp3".
+
+        Raises:
+            ValueError: If output_format isn't one of OUTPUT_FORMATS.
         """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
         self.credentials_path = credentials_path or self.default_credentials_path()
         self.download_directory = download_directory or Path(user_downloads_dir())
         self.download_chunk_size = download_chunk_size
@@ -138,11 +378,46 @@ class MrRippah:
         self.retry_delay_seconds = retry_delay_seconds
         self.successful_download_delay_seconds = successful_download_delay_seconds
         self.spotify_oauth_callback = spotify_oauth_callback
+        self.parallel_downloads = parallel_downloads
+        self.output_format = output_format
+        # Looked up once; without ffmpeg every MP3 rip fails the same way
+        self._ffmpeg_found = (
+            output_format != "mp3" or shutil.which("ffmpeg") is not None
+        )
+        self._stream_lock = threading.Lock()
+        self._rate_limiter = None
+        if successful_download_delay_seconds > 0:
+            self._rate_limiter = _TokenBucket(
+                rate=1 / successful_download_delay_seconds,
+                capacity=parallel_downloads,
+            )
+
+        # Pooled keep-alive connections to the Spotify CDN, shared by all workers
+        self._http = requests.Session()
+        self._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=parallel_downloads,
+                pool_maxsize=parallel_downloads * 2,
+            ),
+        )
+        # Album art downloads; the pool is started by connect() and shut down by
+        # close(), so a closed instance can be connected again
+        self._art_pool: ThreadPoolExecutor | None = None
+        self._album_art: OrderedDict[str, Future[bytes | None]] = OrderedDict()
+        self._album_art_lock = threading.Lock()
+        # Locks serializing rips that target the same file
+        self._track_path_locks: dict[Path, threading.Lock] = {}
+        # Album directories already created, so each is only made once
+        self._created_directories: set[Path] = set()
 
     @staticmethod
+    @functools.cache
     def default_credentials_path() -> Path:
         """Get the default path for storing Spotify credentials.
 
+        The result is cached, so the cache directory is only checked and created once.
+
         Returns:
             Path to credentials.json in platform-specific cache directory.
         """
@@ -162,8 +437,24 @@ class MrRippah:
             The normalized Spotify URI (e.g., spotify:track:...) if a URL
             was provided and matched, otherwise returns the original string.
         """
+        if url.startswith("spotify:"):
+            return url
+
         if url.startswith(("http://", "https://")):
-            match = re.search(r"/(playlist|track)/([A-Za-z0-9]{22})", url)
+            # Fast path for canonical links: strip the host and look up the type
+            type_, _, rest = url.removeprefix(SPOTIFY_WEB_URL).partition("/")
+            uri_prefix = SPOTIFY_URI_PREFIXES.get(type_)
+            item_id = rest[:22]
+            if (
+                uri_prefix
+                and len(item_id) == 22
+                and item_id.isascii()
+                and item_id.isalnum()
+            ):
+                return uri_prefix + item_id
+
+            # Fall back to searching links with extra path segments (e.g. /intl-de/)
+            match = SPOTIFY_URL_REGEX.search(url)
             if match:
                 type_, item_id = match.groups()
                 return f"spotify:{type_}:{item_id}"
@@ -179,7 +470,7 @@ class MrRippah:
         Returns:
             True if valid Spotify playlist URI format, False otherwise.
         """
-        return bool(SPOTIFY_PLAYLIST_REGEX.match(playlist_uri))
+        return SPOTIFY_PLAYLIST_REGEX.fullmatch(playlist_uri) is not None
 
     @staticmethod
     def is_spotify_track_uri(track_uri: str) -> bool:
@@ -191,7 +482,20 @@ class MrRippah:
         Returns:
             True if valid Spotify track URI format, False otherwise.
         """
-        return bool(SPOTIFY_TRACK_REGEX.match(track_uri))
+        return SPOTIFY_TRACK_REGEX.fullmatch(track_uri) is not None
+
+    @staticmethod
+    def spotify_uri_type(uri: str) -> str | None:
+        """Classify a Spotify URI as a playlist or track with a single match.
+
+        Args:
+            uri: String to classify as a Spotify URI.
+
+        Returns:
+            "playlist" or "track" if uri is a valid URI of that type, None otherwise.
+        """
+        match = SPOTIFY_URI_REGEX.fullmatch(uri)
+        return match.group(1) if match else None
 
     def connect(self) -> Self:
         """Start Spotify session with OAuth authentication.
@@ -206,6 +510,9 @@ class MrRippah:
             ConnectionRefusedError: If authentication fails after all retry attempts.
             RuntimeError: If session creation fails after all retry attempts.
         """
+        if self._art_pool is None:
+            self._art_pool = ThreadPoolExecutor(max_workers=self.parallel_downloads)
+
         config_builder = Session.Configuration.Builder()
         config_builder.set_stored_credential_file(self.credentials_path)
         librespot_config = config_builder.build()
@@ -226,13 +533,13 @@ class MrRippah:
                     self.spotify_oauth_callback, success_page
                 ).create()
             except (RuntimeError, ConnectionRefusedError) as e:
-                logger.debug(f"Failed to get librespot session: {e}")
+                logger.debug("Failed to get librespot session: %s", e)
                 num_retries += 1
                 if num_retries < self.spotify_authentication_retries:
-                    wait_time = self.retry_delay_seconds * num_retries
-                    logger.debug(f"Retrying in {wait_time} seconds")
+                    wait_time = self._backoff(num_retries)
+                    logger.debug("Retrying in %.1f seconds", wait_time)
                     time.sleep(wait_time)
-                    logger.debug(f"Retry attempt {num_retries} for librespot session")
+                    logger.debug("Retry attempt %d for librespot session", num_retries)
             else:
                 self._api = self._session.api()
                 break
@@ -253,6 +560,11 @@ class MrRippah:
             pass
         self._session = None
         self._api = None
+        if self._art_pool is not None:
+            self._art_pool.shutdown(wait=False, cancel_futures=True)
+            self._art_pool = None
+        self._album_art.clear()
+        self._http.close()
 
     def __enter__(self) -> Self:
         """Enter context manager and establish Spotify connection.
@@ -277,20 +589,26 @@ class MrRippah:
         playlist_uri: str,
         download_directory: Path | None = None,
         show_progress: bool = True,
+        force: bool = False,
     ) -> list[TrackRipResult]:
         """Download all tracks in Spotify playlist.
 
-        Accepts playlist URI (spotify:playlist:ID) or full Spotify URL. Creates a unique
-        subdirectory for the playlist and downloads all tracks with metadata and album art.
-        Progress bar is automatically disabled in verbose/debug mode or non-terminal outputs.
+        Accepts playlist URI (spotify:playlist:ID) or full Spotify URL. Downloads all
+        tracks with metadata and album art into a subdirectory named after the playlist
+        ID. Re-running a playlist resumes it in that directory, skipping tracks that are
+        already ripped. Progress bar is automatically disabled in verbose/debug mode or
+        non-terminal outputs.
 
         Args:
             playlist_uri: Spotify playlist URI (spotify:playlist:ID) or full URL
                 (https://open.spotify.com/playlist/ID).
             download_directory: Directory to save ripped playlist. Defaults to instance's
-                download_directory if None. A subdirectory with the playlist ID will be created.
+                download_directory if None. A subdirectory with the playlist ID will be used.
             show_progress: Whether to display progress bar. Automatically disabled if logging
                 level is DEBUG or output is not a TTY. Defaults to True.
+            force: Whether to re-rip the whole playlist. If True, it's ripped into a
+                new, uniquely numbered directory, leaving earlier rips untouched.
+                Defaults to False.
 
         Returns:
             List of TrackRipResult objects containing success/failure status for each track.
@@ -308,73 +626,307 @@ class MrRippah:
         if download_directory is None:
             download_directory = self.download_directory
 
-        playlist_download_directory = make_unique_directory(
-            download_directory / playlist_uri.split(":")[-1]
-        )
+        playlist_download_directory = download_directory / playlist_uri.split(":")[-1]
+        if force:
+            playlist_download_directory = make_unique_directory(
+                playlist_download_directory
+            )
+        else:
+            playlist_download_directory.mkdir(parents=True, exist_ok=True)
         playlist_id = PlaylistId.from_uri(playlist_uri)
         playlist = self._api.get_playlist(playlist_id)
-        results = []
 
-        # Disable progress bar in verbose/debug mode or non-terminal outputs
+        # Disable progress bar in verbose/debug mode or non-terminal outputs. It's
+        # drawn on stderr alongside the logs, leaving stdout for results
         show_progress = (
             show_progress
             and logger.getEffectiveLevel() > logging.DEBUG
-            and sys.stdout.isatty()
+            and sys.stderr.isatty()
         )
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            disable=not show_progress,
-            transient=True,
-        ) as progress:
-            task = progress.add_task("Ripping!", total=playlist.length)
-            for track_num, item in enumerate(playlist.contents.items, start=1):
-                logger.debug(
-                    f"{item.uri} Ripping track {track_num:,}/{playlist.length:,}"
-                )
-                try:
-                    result = self.rip_track(item.uri, playlist_download_directory)
-                except RipFailedError as e:
-                    logger.debug(f"{e.uri} {e}")
-                    result = TrackRipResult(
-                        uri=e.uri,
-                        title=e.title,
-                        success=False,
-                        failure_reason=str(e),
+        # Fetch track metadata (and resolve re-links) up front so the round-trips
+        # overlap each other and the rips, instead of each rip waiting on its own
+        metadata_executor = ThreadPoolExecutor(max_workers=METADATA_PREFETCH_WORKERS)
+        metadata_futures = {
+            item.uri: metadata_executor.submit(
+                self._get_track_metadata, _track_id_from_uri(item.uri)
+            )
+            for item in playlist.contents.items
+            if self.is_spotify_track_uri(item.uri)
+        }
+
+        executor = ThreadPoolExecutor(max_workers=self.parallel_downloads)
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=Console(stderr=True),
+                disable=not show_progress,
+                transient=True,
+                # Tracks take seconds each, so a few redraws a second is plenty
+                refresh_per_second=4,
+            ) as progress:
+                task = progress.add_task("Ripping!", total=playlist.length)
+                futures = [
+                    executor.submit(
+                        self._rip_playlist_track,
+                        item.uri,
+                        playlist_download_directory,
+                        track_num,
+                        playlist.length,
+                        metadata_futures.get(item.uri),
                     )
-                else:
-                    if (
-                        self.successful_download_delay_seconds > 0
-                        and track_num != playlist.length
-                    ):
-                        logger.debug(
-                            f"Waiting {self.successful_download_delay_seconds} seconds to start next download"
-                        )
-                        time.sleep(self.successful_download_delay_seconds)
-                results.append(result)
-                progress.update(task, advance=1)
+                    for track_num, item in enumerate(playlist.contents.items, start=1)
+                ]
+                for _ in as_completed(futures):
+                    progress.advance(task)
+        finally:
+            # Drop queued tracks if we're bailing out early (e.g. Ctrl-C)
+            executor.shutdown(wait=False, cancel_futures=True)
+            metadata_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Report results in playlist order, regardless of completion order
+        results = [future.result() for future in futures]
 
         num_successes = sum(1 for r in results if r.success)
         end_time = time.perf_counter()
         logger.info(
-            f"Ripped {num_successes:,}/{playlist.length:,} tracks in {end_time - start_time:,.2f} seconds"
+            "Ripped %d/%d tracks in %.2f seconds",
+            num_successes,
+            playlist.length,
+            end_time - start_time,
         )
-        logger.info(f"Playlist saved to {playlist_download_directory}")
+        logger.info("Playlist saved to %s", playlist_download_directory)
         return results
 
+    def _rip_playlist_track(
+        self,
+        track_uri: str,
+        download_directory: Path,
+        track_num: int,
+        num_tracks: int,
+        metadata_future: Future[Metadata.Track] | None = None,
+    ) -> TrackRipResult:
+        """Rip one playlist track on a worker thread, capturing rip failures.
+
+        Tracks already in the playlist directory are skipped, so an interrupted rip
+        resumes where it left off and tracks listed twice are only ripped once.
+
+        Args:
+            track_uri: Spotify track URI from the playlist.
+            download_directory: Playlist download directory.
+            track_num: 1-based position of the track in the playlist.
+            num_tracks: Total number of tracks in the playlist.
+            metadata_future: Prefetched track metadata. If None, or if the prefetch
+                failed, rip_track fetches the metadata itself.
+
+        Returns:
+            TrackRipResult for the track, with success False if the rip failed.
+        """
+        logger.debug("%s Ripping track %d/%d", track_uri, track_num, num_tracks)
+        metadata = None
+        if metadata_future is not None:
+            try:
+                metadata = metadata_future.result()
+            except Exception as e:
+                logger.debug("%s Failed to prefetch metadata: %s", track_uri, e)
+
+        try:
+            result = self.rip_track(track_uri, download_directory, metadata=metadata)
+        except RipFailedError as e:
+            logger.debug("%s %s", e.uri, e)
+            return TrackRipResult(
+                uri=e.uri,
+                title=e.title,
+                success=False,
+                failure_reason=str(e),
+            )
+        except Exception as e:
+            # Any other error only fails this track, instead of surfacing once the
+            # whole playlist is done and losing every other track's result
+            logger.debug("%s Failed to rip", track_uri, exc_info=True)
+            return TrackRipResult(
+                uri=track_uri,
+                title=metadata.name if metadata is not None else None,
+                success=False,
+                failure_reason=f"Unexpected error: {e!r}",
+            )
+
+        return result
+
+    def _stream_to_file(self, stream: BinaryIO, track_path: Path) -> None:
+        """Save an Ogg stream to a file as is.
+
+        Args:
+            stream: Readable Ogg Vorbis stream.
+            track_path: Path of the Ogg file to write. Overwritten if it exists.
+        """
+        with open(track_path, "wb") as file:
+            shutil.copyfileobj(stream, file, self.download_chunk_size)
+
+    def _stream_to_mp3(self, stream: BinaryIO, track_path: Path) -> None:
+        """Encode an Ogg stream to an MP3 file while it is still downloading.
+
+        Chunks are written to ffmpeg's stdin as they arrive, so the download and
+        the encode overlap and the track is never buffered in memory.
+
+        Args:
+            stream: Readable Ogg Vorbis stream.
+            track_path: Path of the MP3 file to write. Overwritten if it exists.
+
+        Raises:
+            subprocess.CalledProcessError: If ffmpeg exits with an error.
+        """
+        # ffmpeg's log goes to a file so a chatty stderr can't fill the pipe and
+        # block it while we're blocked writing to its stdin
+        with tempfile.TemporaryFile() as ffmpeg_log:
+            ffmpeg = subprocess.Popen(
+                [*FFMPEG_MP3_COMMAND, str(track_path)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=ffmpeg_log,
+            )
+            try:
+                # librespot's read() misbehaves for sizes beyond its own chunk size
+                # on short tracks, so keep copies at download_chunk_size
+                shutil.copyfileobj(stream, ffmpeg.stdin, self.download_chunk_size)
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its return code says why
+            except BaseException:
+                ffmpeg.kill()
+                raise
+            finally:
+                # Always release the pipe; closing it also signals EOF to ffmpeg
+                try:
+                    ffmpeg.stdin.close()
+                except BrokenPipeError:
+                    pass
+                ffmpeg.wait()
+
+            if ffmpeg.returncode != 0:
+                ffmpeg_log.seek(0)
+                raise subprocess.CalledProcessError(
+                    ffmpeg.returncode, ffmpeg.args, stderr=ffmpeg_log.read()
+                )
+
+    def _get_track_metadata(self, track_id: TrackId) -> Metadata.Track:
+        """Fetch track metadata, following a re-link to the playable alternative.
+
+        Args:
+            track_id: ID of the track.
+
+        Returns:
+            Metadata of the track, or of its first alternative if it has one.
+        """
+        metadata = self._api.get_metadata_4_track(track_id)
+        if metadata.alternative:
+            alternative_id = TrackId.from_hex(metadata.alternative[0].gid.hex())
+            metadata = self._api.get_metadata_4_track(alternative_id)
+        return metadata
+
+    def _album_art_future(self, cdn_url: str) -> Future[bytes | None]:
+        """Get the download of an album cover, starting it if needed.
+
+        Downloads of the most recently used covers are kept, so tracks from the same
+        album share a single request. Downloads that are cancelled or don't return
+        an image are dropped, so a transient failure doesn't cost every later track
+        from the album its cover; the next track tries again.
+
+        Args:
+            cdn_url: URL of the cover image.
+
+        Returns:
+            Future resolving to the image data, as returned by _download_album_art.
+        """
+
+        def forget_if_failed(future: Future[bytes | None]) -> None:
+            if (
+                future.cancelled()
+                or future.exception() is not None
+                or future.result() is None
+            ):
+                with self._album_art_lock:
+                    if self._album_art.get(cdn_url) is future:
+                        del self._album_art[cdn_url]
+
+        with self._album_art_lock:
+            future = self._album_art.get(cdn_url)
+            if future is not None:
+                self._album_art.move_to_end(cdn_url)
+                return future
+
+            future = self._art_pool.submit(self._download_album_art, cdn_url)
+            self._album_art[cdn_url] = future
+            if len(self._album_art) > ALBUM_ART_CACHE_SIZE:
+                self._album_art.popitem(last=False)
+
+        future.add_done_callback(forget_if_failed)
+        return future
+
+    def _download_album_art(self, cdn_url: str) -> bytes | None:
+        """Download an album cover image from the Spotify CDN.
+
+        Rate limited (429) requests are retried up to track_download_retries times,
+        waiting as long as the Retry-After header asks, or with backoff if it's missing.
+        Waits longer than the longest backoff aren't worth it, so the cover is skipped.
+
+        Args:
+            cdn_url: URL of the cover image.
+
+        Returns:
+            The image data, or None if the CDN didn't return the image or the
+            request failed.
+        """
+        num_retries = 0
+        while True:
+            # Stream the body so error responses are never downloaded and the
+            # connection goes back to the pool as soon as the image is read
+            try:
+                with self._http.get(cdn_url, stream=True, timeout=10) as response:
+                    if response.status_code == 200:
+                        return b"".join(response.iter_content(self.download_chunk_size))
+                    if (
+                        response.status_code != 429
+                        or num_retries >= self.track_download_retries
+                    ):
+                        return None
+                    retry_after = response.headers.get("Retry-After", "")
+            except requests.RequestException as e:
+                # Missing album art shouldn't fail the track
+                logger.debug("Failed to download album art: %s", e)
+                return None
+
+            num_retries += 1
+            if retry_after.isdigit():
+                wait_time = int(retry_after)
+                if wait_time > self.retry_delay_seconds * 8:
+                    # Not worth holding up the track; save it without art instead
+                    logger.debug(
+                        "Album art rate limited for %d seconds, skipping", wait_time
+                    )
+                    return None
+            else:
+                wait_time = self._backoff(num_retries)
+            logger.debug("Album art rate limited, retrying in %.1f seconds", wait_time)
+            time.sleep(wait_time)
+
     def rip_track(
-        self, track_uri: str, download_directory: Path | None
+        self,
+        track_uri: str,
+        download_directory: Path | None,
+        metadata: Metadata.Track | None = None,
+        force: bool = False,
     ) -> TrackRipResult:
         """Download a single track with metadata and album art.
 
-        Downloads track audio stream, converts to MP3, and embeds ID3 tags including title,
-        artist, album, track number, date, ISRC, Spotify URIs, and album art. Handles track
-        re-linking for alternative versions and retries failed downloads with exponential backoff.
+        Downloads track audio stream, converts to MP3 (unless output_format is "ogg"), and
+        embeds ID3 tags or Vorbis comments including title, artist, album, track number,
+        date, ISRC, Spotify URIs, and album art. Handles track re-linking for alternative
+        versions and retries failed downloads with exponential backoff.
 
-        Track is saved to: download_directory/Artist/Album/TrackNumber - Title.mp3
+        Track is saved to: download_directory/Artist/Album/TrackNumber - Title.mp3 (or .ogg)
 
         Args:
             track_uri: Spotify track URI (spotify:track:ID) or just the track ID. Local
@@ -382,12 +934,18 @@ class MrRippah:
             download_directory: Base directory for saving the track. The track will be
                 organized into Artist/Album subdirectories. Defaults to instance's
                 download_directory if None.
+            metadata: Already fetched metadata for track_uri, with re-links resolved
+                as by _get_track_metadata, e.g. prefetched by rip_playlist. Fetched
+                from Spotify if None.
+            force: Whether to re-rip the track if its file already exists. If False,
+                an existing non-empty file is left as is. Defaults to False.
 
         Returns:
             TrackRipResult with success status and track information.
 
         Raises:
-            RipFailedError: If track is local, unplayable, has invalid URI, or fails to
+            RipFailedError: If track is local, unplayable, has invalid URI, needs
+                ffmpeg to convert to MP3 and it isn't installed, or fails to
                 download after all retry attempts.
         """
         download_directory = download_directory or self.download_directory
@@ -400,120 +958,223 @@ class MrRippah:
         if not track_uri.startswith("spotify:"):
             track_uri = f"spotify:track:{track_uri}"
         try:
-            track_id = TrackId.from_uri(track_uri)
+            track_id = _track_id_from_uri(track_uri)
         except RuntimeError:
             raise RipFailedError("Invalid track URI", track_uri)
 
-        logger.debug(f"{track_uri} Getting track metadata")
-        metadata = self._api.get_metadata_4_track(track_id)
-        if metadata.alternative:
-            track_id = TrackId.from_hex(metadata.alternative[0].gid.hex())
-            metadata = self._api.get_metadata_4_track(track_id)
-            logger.debug(f"{track_uri} Re-linked to {track_id.to_spotify_uri()}")
+        if metadata is None:
+            logger.debug("%s Getting track metadata", track_uri)
+            metadata = self._get_track_metadata(track_id)
+        gid_hex = metadata.gid.hex()
+        if gid_hex != track_id.hex_id():
+            track_id = TrackId.from_hex(gid_hex)
+            logger.debug("%s Re-linked to %s", track_uri, track_id.to_spotify_uri())
 
         if not metadata.file and not metadata.alternative:
             raise RipFailedError("Track is unplayable", track_uri, title=metadata.name)
 
-        logger.debug(f"{track_uri} Saving track stream")
-        num_retries = 0
-        while num_retries < self.track_download_retries:
+        album = metadata.album
+        album_name = album.name
+        album_artist = album.artist[0].name
+
+        track_path = (
+            download_directory
+            / sanitize_path_component(album_artist)
+            / sanitize_path_component(album_name)
+            / sanitize_path_component(
+                f"{metadata.number:02} - {metadata.name}.{self.output_format}"
+            )
+        )
+        # Rips of the same file (a track listed twice in a playlist, or two tracks
+        # whose names sanitize the same) take turns, so the later one finds the
+        # earlier one's file instead of racing it
+        with self._track_path_locks.setdefault(track_path, threading.Lock()):
+            return self._rip_track_to_path(
+                track_uri, track_id, metadata, track_path, force
+            )
+
+    def _rip_track_to_path(
+        self,
+        track_uri: str,
+        track_id: TrackId,
+        metadata: Metadata.Track,
+        track_path: Path,
+        force: bool,
+    ) -> TrackRipResult:
+        """Download, convert and tag a track into its final path.
+
+        The track is written to a temporary file next to track_path and only moved
+        into place once its tags are saved. Callers must hold the lock for
+        track_path.
+
+        Args:
+            track_uri: Spotify track URI, as requested.
+            track_id: ID of the track to download, after any re-link.
+            metadata: Metadata of the track to download.
+            track_path: Path to save the track to.
+            force: Whether to re-rip the track if track_path already exists.
+
+        Returns:
+            TrackRipResult with success status and track information.
+
+        Raises:
+            RipFailedError: If ffmpeg is missing or the track fails to download.
+        """
+        album = metadata.album
+        album_name = album.name
+        album_artist = album.artist[0].name
+
+        if not force:
             try:
-                track_stream = self._session.content_feeder().load(
-                    track_id,
-                    VorbisOnlyAudioQuality(AudioQuality.VERY_HIGH),
-                    True,  # Pre-load
-                    None,
+                already_ripped = track_path.stat().st_size > 0
+            except FileNotFoundError:
+                already_ripped = False
+            if already_ripped:
+                logger.debug("%s Already ripped to %s, skipping", track_uri, track_path)
+                return TrackRipResult(
+                    uri=track_uri, title=metadata.name, path=track_path
                 )
+        if not self._ffmpeg_found:
+            raise RipFailedError("ffmpeg not found", track_uri, title=metadata.name)
+        if track_path.parent not in self._created_directories:
+            # Two workers may both get here for a new album; exist_ok covers that
+            track_path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_directories.add(track_path.parent)
+
+        # Fetch album art while the track is downloaded and converted
+        art_future = None
+        if album.cover_group.image:
+            logger.debug("%s Downloading album art", track_uri)
+            image = album.cover_group.image[-1]
+            cdn_url = f"{SPOTIFY_CDN_URL}{image.file_id.hex()}"
+            art_future = self._album_art_future(cdn_url)
+
+        if self.output_format == "ogg":
+            save_stream = self._stream_to_file
+        else:
+            save_stream = self._stream_to_mp3
+        logger.debug(
+            "%s Ripping track stream to %s", track_uri, self.output_format.upper()
+        )
+        # Rip and tag under a temporary name, so an interrupted or failed rip never
+        # leaves a truncated or untagged file that a later run would skip. The
+        # track path lock keeps it unique within this process, the PID across
+        # processes; mkstemp would leave the track readable only by its owner
+        part_path = track_path.with_name(f"{track_path.name}.{os.getpid()}.part")
+        try:
+            num_retries = 0
+            while num_retries < self.track_download_retries:
+                try:
+                    # Only the stream requests are rate limited; encoding, tagging and
+                    # album art downloads run freely
+                    if self._rate_limiter is not None:
+                        self._rate_limiter.acquire()
+
+                    # Serialize stream setup (audio key + CDN lookup) on the shared
+                    # session; the chunk downloads themselves still overlap
+                    with self._stream_lock:
+                        track_stream = self._session.content_feeder().load(
+                            track_id,
+                            VorbisOnlyAudioQuality(AudioQuality.VERY_HIGH),
+                            True,  # Pre-load
+                            None,
+                        )
 
-                audio_bytes = BytesIO()
-                while True:
-                    chunk = track_stream.input_stream.stream().read(
-                        self.download_chunk_size
-                    )
-                    if not chunk:
-                        break
-
-                    audio_bytes.write(chunk)
-            except Exception as e:
-                num_retries += 1
-                logger.debug(f"{track_uri} Failed to rip: {e}")
-                wait_time = self.retry_delay_seconds * num_retries
-                logger.debug(f"Retrying in {wait_time} seconds")
-                time.sleep(wait_time)
-                if num_retries >= self.track_download_retries:
-                    logger.error(
-                        f"{track_uri} Failed to rip after {num_retries} retries"
+                    stream = track_stream.input_stream.stream()
+                    try:
+                        save_stream(stream, part_path)
+                    finally:
+                        # Drop librespot's buffer of the decrypted track right away
+                        # instead of holding it through retries until GC
+                        stream.close()
+                except subprocess.CalledProcessError as e:
+                    part_path.unlink(missing_ok=True)
+                    logger.debug(
+                        "%s ffmpeg failed: %s",
+                        track_uri,
+                        e.stderr.decode(errors="replace"),
                     )
                     raise RipFailedError(
-                        "Failed to get track stream",
+                        "Failed to convert track to MP3",
                         track_uri,
                         title=metadata.name,
                         original_error=e,
                     )
+                except Exception as e:
+                    part_path.unlink(missing_ok=True)
+                    logger.debug("%s Failed to rip: %r", track_uri, e)
+                    if not _is_transient_error(e):
+                        # Won't go away by retrying, so fail straight away
+                        raise RipFailedError(
+                            "Failed to save track"
+                            if isinstance(e, OSError)
+                            else "Failed to get track stream",
+                            track_uri,
+                            title=metadata.name,
+                            original_error=e,
+                        )
+                    num_retries += 1
+                    if num_retries >= self.track_download_retries:
+                        logger.error(
+                            "%s Failed to rip after %d retries", track_uri, num_retries
+                        )
+                        raise RipFailedError(
+                            "Failed to get track stream",
+                            track_uri,
+                            title=metadata.name,
+                            original_error=e,
+                        )
+                    wait_time = self._backoff(num_retries)
+                    logger.debug("Retrying in %.1f seconds", wait_time)
+                    time.sleep(wait_time)
+                else:
+                    break
+
+            date = album.date
+            tags = {
+                "title": metadata.name,
+                "artist": metadata.artist[0].name,
+                "album": album_name,
+                "albumartist": album_artist,
+                "tracknumber": str(metadata.number),
+                "discnumber": str(metadata.disc_number),
+                "date": f"{date.year}-{date.month:02}-{date.day:02}",
+            }
+            external_ids = {x.type: x.id for x in metadata.external_id}
+            if "isrc" in external_ids:
+                tags["isrc"] = external_ids["isrc"]
+
+            spotify_track_uris = [track_uri]
+            final_track_uri = track_id.to_spotify_uri()
+            if final_track_uri != track_uri:
+                # Store original and re-linked URI in tags
+                spotify_track_uris.append(final_track_uri)
+
+            image_data = art_future.result() if art_future is not None else None
+
+            logger.debug("%s Saving track metadata to tags", track_uri)
+            if self.output_format == "ogg":
+                _save_vorbis_comments(part_path, tags, spotify_track_uris, image_data)
             else:
-                break
-
-        logger.debug(f"{track_uri} Converting track to MP3")
-        audio_bytes.seek(0)
-        audio = AudioSegment.from_file(audio_bytes, format="ogg")
-        track_path = (
-            download_directory
-            / metadata.album.artist[0].name
-            / metadata.album.name
-            / f"{metadata.number:02} - {metadata.name}.mp3"
-        )
-        track_path.parent.mkdir(parents=True, exist_ok=True)
-        audio.export(
-            track_path,
-            format="mp3",
-            parameters=["-q:a", "0"],
-        )
+                _save_id3_tags(part_path, tags, spotify_track_uris, image_data)
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
+        os.replace(part_path, track_path)
 
-        logger.debug(f"{track_uri} Saving track metadata to ID3 tags")
-        audio = EasyID3(track_path)
-        audio["title"] = metadata.name
-        audio["artist"] = metadata.artist[0].name
-        audio["albumartist"] = metadata.album.artist[0].name
-        audio["tracknumber"] = str(metadata.number)
-        audio["discnumber"] = str(metadata.disc_number)
+        return TrackRipResult(uri=track_uri, title=metadata.name, path=track_path)
 
-        date = metadata.album.date
-        audio["date"] = f"{date.year}-{date.month:02}-{date.day:02}"
+    def _backoff(self, attempt: int) -> float:
+        """Get how long to wait before a retry.
 
-        for external_id in metadata.external_id:
-            if external_id.type == "isrc":
-                audio["isrc"] = external_id.id
-                break
-
-        audio.save()
-
-        audio = ID3(track_path)
-        spotify_track_uris = [track_uri]
-        final_track_uri = track_id.to_spotify_uri()
-        if final_track_uri != track_uri:
-            # Store original and re-linked URI in ID3 tag
-            spotify_track_uris.append(final_track_uri)
-        audio.add(TXXX(desc="spotify_uris", text=spotify_track_uris))
-        audio.add(COMM(encoding=3, lang="eng", desc="", text=[track_uri]))
-
-        # Download album art
-        if metadata.album.cover_group.image:
-            logger.debug(f"{track_uri} Downloading album art")
-            image = metadata.album.cover_group.image[-1]
-            file_id_hex = image.file_id.hex()
-            cdn_url = f"{SPOTIFY_CDN_URL}{file_id_hex}"
-            response = requests.get(cdn_url)
-            if response.status_code == 200:
-                audio.add(
-                    APIC(
-                        encoding=3,
-                        mime="image/jpeg",
-                        type=3,
-                        desc="0",
-                        data=response.content,
-                    )
-                )
+        Uses capped exponential backoff with full jitter so concurrent workers
+        that fail together don't all retry at the same moment.
 
-        audio.save()
+        Args:
+            attempt: Number of the failed attempt, starting at 1.
 
-        return TrackRipResult(uri=track_uri, title=metadata.name, path=track_path)
+        Returns:
+            Delay in seconds.
+        """
+        delay = self.retry_delay_seconds * 2 ** (attempt - 1)
+        return random.uniform(0, min(delay, self.retry_delay_seconds * 8))
@@ -1,24 +1,39 @@
 """Update checking functionality for mr-rippah."""
 
+import functools
 import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import Future
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
-from packaging.version import InvalidVersion, Version
-from platformdirs import user_cache_dir
+if TYPE_CHECKING:
+    import requests
+    from packaging.version import Version
 
 logger = logging.getLogger(__name__)
 
+# Parsed update cache, shared by every check in this process
+_CACHE_NOT_READ = object()
+_cache_data = _CACHE_NOT_READ
+
 # Constants
 PACKAGE_NAME = "mr-rippah"
 GITHUB_RELEASES_URL = "https://api.github.com/repos/cvdub/mr-rippah/releases/latest"
-CACHE_DIR = Path(user_cache_dir("Mr. Rippah", ensure_exists=True))
-CACHE_FILE = CACHE_DIR / "update_check.json"
+CACHE_FILE_NAME = "update_check.txt"
 CACHE_DURATION_SECONDS = 86_400  # 24 hours
-REQUEST_TIMEOUT_SECONDS = 5
+FAILED_CHECK_CACHE_DURATION_SECONDS = 3_600  # 1 hour
+REQUEST_TIMEOUT_SECONDS = (1.0, 4.0)  # (connect, read)
+SIMPLE_VERSION_CHARACTERS = frozenset("0123456789.")
+
+# Update checks are skipped when opted out or running under CI
+UPDATE_CHECK_DISABLED = bool(
+    os.environ.get("MR_RIPPAH_NO_UPDATE_CHECK") or os.environ.get("CI")
+)
 
 
 def check_for_update() -> tuple[str, str] | None:
@@ -33,12 +48,16 @@ def check_for_update() -> tuple[str, str] | None:
     5. Returns update info if newer version exists
 
     The function is designed to fail silently - any errors result in
-    returning None rather than raising exceptions.
+    returning None rather than raising exceptions. It returns None without
+    doing any work if MR_RIPPAH_NO_UPDATE_CHECK or CI is set.
 
     Returns:
         Tuple of (current_version, latest_version) if an update is available,
         None if no update available or if check fails.
     """
+    if UPDATE_CHECK_DISABLED:
+        return None
+
     # Get current version
     current_version = _get_current_version()
     if current_version is None:
@@ -52,31 +71,118 @@ def check_for_update() -> tuple[str, str] | None:
     if cache_data and not _is_cache_stale(cache_data):
         # Use cached version
         latest_version = cache_data.get("latest_version")
-        logger.debug(f"Using cached latest version: {latest_version}")
+        logger.debug("Using cached latest version: %s", latest_version)
     else:
         # Query GitHub
-        latest_version = _get_latest_version()
-        if latest_version:
-            _write_cache(latest_version)
-            logger.debug(f"Fetched latest version from GitHub: {latest_version}")
+        latest_release = _get_latest_version(cache_data)
+        if latest_release:
+            latest_version, etag = latest_release
+            _write_cache(latest_version, etag)
+            logger.debug("Fetched latest version from GitHub: %s", latest_version)
+        else:
+            # Keep what was known before, and don't retry on every run while
+            # GitHub is unreachable
+            latest_version = cache_data["latest_version"] if cache_data else ""
+            etag = cache_data["etag"] if cache_data else ""
+            _write_cache(latest_version, etag, FAILED_CHECK_CACHE_DURATION_SECONDS)
+
+    if not latest_version or latest_version == current_version:
+        return None
 
-    if latest_version is None:
+    # Compare plain release versions without parsing them
+    current = _release_tuple(current_version)
+    latest = _release_tuple(latest_version)
+    if current is not None and latest is not None:
+        # Pad the shorter version with zeros so "0.3" and "0.3.0" compare equal
+        if len(current) < len(latest):
+            current += (0,) * (len(latest) - len(current))
+        elif len(latest) < len(current):
+            latest += (0,) * (len(current) - len(latest))
+        if latest > current:
+            return (current_version, latest_version)
         return None
 
     # Compare versions
+    from packaging.version import InvalidVersion
+
     try:
-        current = Version(current_version)
-        latest = Version(latest_version)
+        current = _parse_version(current_version)
+        latest = _parse_version(latest_version)
 
         if latest > current:
             return (current_version, latest_version)
     except InvalidVersion as e:
-        logger.debug(f"Invalid version format: {e}")
+        logger.debug("Invalid version format: %s", e)
         return None
 
     return None
 
 
+def _release_tuple(version_string: str) -> tuple[int, ...] | None:
+    """
+    Parse a plain dotted release version into a tuple of integers.
+
+    Args:
+        version_string: Version string (e.g., "0.2.0").
+
+    Returns:
+        Tuple of release components (e.g., (0, 2, 0)), or None if the version
+        has anything other than digits and dots (pre-releases, local versions)
+        and needs full parsing.
+    """
+    if not SIMPLE_VERSION_CHARACTERS.issuperset(version_string):
+        return None
+
+    try:
+        return tuple(map(int, version_string.split(".")))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_version(version_string: str) -> "Version":
+    """
+    Parse a version string, reusing earlier results for the same string.
+
+    Args:
+        version_string: Version string (e.g., "0.3.0rc1").
+
+    Returns:
+        Parsed Version.
+
+    Raises:
+        InvalidVersion: If the string isn't a valid version.
+    """
+    from packaging.version import Version
+
+    return Version(version_string)
+
+
+def check_for_update_async() -> Future:
+    """
+    Start an update check in the background.
+
+    The check runs on a daemon thread, so a slow GitHub request never holds
+    up the caller or delays interpreter exit.
+
+    Returns:
+        Future resolving to the result of check_for_update().
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(check_for_update())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="update-check", daemon=True).start()
+    return future
+
+
+@functools.lru_cache(maxsize=1)
 def _get_current_version() -> str | None:
     """
     Get the currently installed version of mr-rippah.
@@ -87,104 +193,191 @@ def _get_current_version() -> str | None:
     try:
         return version(PACKAGE_NAME)
     except PackageNotFoundError:
-        logger.debug(f"Package {PACKAGE_NAME} not found in installed packages")
+        logger.debug("Package %s not found in installed packages", PACKAGE_NAME)
         return None
 
 
-def _get_latest_version() -> str | None:
+@functools.lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """
+    Get the shared HTTP session used to query GitHub.
+
+    The session keeps its connection alive between checks and retries
+    transient gateway errors once, but not connection failures or timeouts.
+
+    Returns:
+        Configured requests Session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=2,
+            # Connection and read failures aren't retried, so REQUEST_TIMEOUT_SECONDS
+            # is the whole wait on an unreachable network
+            max_retries=Retry(
+                total=1,
+                connect=0,
+                read=0,
+                status=1,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+            ),
+        ),
+    )
+    session.headers["Accept"] = "application/vnd.github+json"
+    session.headers["User-Agent"] = f"{PACKAGE_NAME}/{_get_current_version() or 'dev'}"
+    return session
+
+
+def _get_latest_version(cache_data: dict | None = None) -> tuple[str, str] | None:
     """
     Query GitHub Releases API for the latest version of mr-rippah.
 
-    Makes HTTP request to GitHub's releases API with a timeout.
+    Makes HTTP request to GitHub's releases API with separate connect and
+    read timeouts, so an unreachable network fails fast. If the cache
+    has an ETag, the request is conditional and a 304 response reuses the
+    cached version without downloading or parsing the release again.
     Fails silently on any network or parsing errors.
 
+    Args:
+        cache_data: Previously cached update check data, if any.
+
     Returns:
-        Latest version string (e.g., "0.3.0") or None if query fails.
+        Tuple of (latest_version, etag), e.g. ("0.3.0", '"abc123"'), or None
+        if query fails.
     """
+    import requests
+
+    headers = {}
+    etag = cache_data.get("etag") if cache_data else None
+    if etag:
+        headers["If-None-Match"] = etag
+
     try:
-        response = requests.get(GITHUB_RELEASES_URL, timeout=REQUEST_TIMEOUT_SECONDS)
+        response = _session().get(
+            GITHUB_RELEASES_URL, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS
+        )
+        if response.status_code == 304:
+            logger.debug("Latest release unchanged since last check")
+            return (cache_data["latest_version"], etag)
+
         response.raise_for_status()
-        data = response.json()
-        tag_name = data["tag_name"]
+        data = json.loads(response.content)
         # Strip 'v' prefix if present (e.g., "v0.2.0" -> "0.2.0")
-        return _parse_version_tag(tag_name)
+        latest_version = data["tag_name"].removeprefix("v")
+        return (latest_version, response.headers.get("ETag", ""))
     except requests.exceptions.RequestException as e:
-        logger.debug(f"Failed to fetch version from GitHub: {e}")
+        logger.debug("Failed to fetch version from GitHub: %s", e)
         return None
     except (KeyError, ValueError, json.JSONDecodeError) as e:
-        logger.debug(f"Failed to parse GitHub response: {e}")
+        logger.debug("Failed to parse GitHub response: %s", e)
         return None
 
 
-def _parse_version_tag(tag: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _cache_file() -> Path:
     """
-    Parse a version tag, stripping the 'v' prefix if present.
+    Get the path to the update check cache file.
 
-    Args:
-        tag: Version tag string (e.g., "v0.2.0" or "0.2.0").
+    The cache directory is only created when the cache is written.
 
     Returns:
-        Version string without 'v' prefix (e.g., "0.2.0").
+        Path to the cache file in the user's cache directory.
     """
-    return tag.lstrip("v")
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("Mr. Rippah")) / CACHE_FILE_NAME
 
 
 def _read_cache() -> dict | None:
     """
     Read cached update check data.
 
+    The cache file is read at most once per process; later calls reuse the
+    parsed data, which _write_cache keeps up to date.
+
     Returns:
-        Dictionary with 'last_check_timestamp' and 'latest_version' keys,
+        Dictionary with 'expires_at', 'latest_version' and 'etag' keys,
         or None if cache doesn't exist or is corrupted.
     """
-    if not CACHE_FILE.exists():
-        return None
+    global _cache_data
+    if _cache_data is _CACHE_NOT_READ:
+        _cache_data = _read_cache_file()
+    return _cache_data
 
-    try:
-        with CACHE_FILE.open("r") as f:
-            data = json.load(f)
 
-        # Validate cache structure
-        if "last_check_timestamp" in data and "latest_version" in data:
-            return data
-    except (json.JSONDecodeError, IOError) as e:
-        logger.debug(f"Failed to read cache file: {e}")
+def _read_cache_file() -> dict | None:
+    """
+    Read and parse the update cache file.
+
+    Returns:
+        Dictionary with 'expires_at', 'latest_version' and 'etag' keys,
+        or None if cache doesn't exist or is corrupted.
+    """
+    # Lines are the expiry deadline, the latest version and its ETag
+    try:
+        expires_at, latest_version, etag = _cache_file().read_bytes().splitlines()
+        return {
+            "expires_at": int(expires_at),
+            "latest_version": latest_version.strip().decode(),
+            "etag": etag.strip().decode(),
+        }
+    except FileNotFoundError:
+        return None
+    except (ValueError, OSError) as e:
+        logger.debug("Failed to read cache file: %s", e)
 
     return None
 
 
-def _write_cache(latest_version: str) -> None:
+def _write_cache(
+    latest_version: str,
+    etag: str = "",
+    duration_seconds: int = CACHE_DURATION_SECONDS,
+) -> None:
     """
     Write update check data to cache file.
 
     Args:
-        latest_version: The latest version string to cache.
+        latest_version: The latest version string to cache, or an empty
+            string if it isn't known.
+        etag: ETag of the GitHub response the version came from.
+        duration_seconds: How long until the cache goes stale.
     """
+    global _cache_data
+    expires_at = int(time.time()) + duration_seconds
+    _cache_data = {
+        "expires_at": expires_at,
+        "latest_version": latest_version,
+        "etag": etag,
+    }
+    payload = f"{expires_at}\n{latest_version}\n{etag}\n".encode()
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache_data = {
-            "last_check_timestamp": time.time(),
-            "latest_version": latest_version,
-        }
-        with CACHE_FILE.open("w") as f:
-            json.dump(cache_data, f, indent=2)
-    except IOError as e:
-        logger.debug(f"Failed to write cache file: {e}")
+        cache_file = _cache_file()
+        try:
+            cache_file.write_bytes(payload)
+        except FileNotFoundError:
+            # Only the first write needs to create the cache directory
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(payload)
+    except OSError as e:
+        logger.debug("Failed to write cache file: %s", e)
 
 
 def _is_cache_stale(cache_data: dict) -> bool:
     """
-    Check if cached data is older than the cache duration.
+    Check if cached data has passed its expiry deadline.
 
     Args:
-        cache_data: Dictionary with 'last_check_timestamp' key.
+        cache_data: Dictionary with 'expires_at' key.
 
     Returns:
-        True if cache is stale (older than 24 hours), False otherwise.
+        True if the cache has expired, False otherwise.
     """
-    try:
-        last_check = cache_data.get("last_check_timestamp", 0)
-        elapsed = time.time() - last_check
-        return elapsed > CACHE_DURATION_SECONDS
-    except (TypeError, ValueError):
-        return True
+    return time.time() >= cache_data["expires_at"]